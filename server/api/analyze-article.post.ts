@@ -1,6 +1,6 @@
 import { OpenAI } from 'openai';
 import * as cheerio from 'cheerio';
-import { getRedditAccessToken, type RedditRule, type RedditRulesResponse } from '../utils/reddit'; // Import Reddit utils
+import { getRedditAccessToken, getCachedRules, setCachedRules, REDDIT_FETCH_RETRY, type RedditRule, type RedditRulesResponse } from '../utils/reddit'; // Import Reddit utils
 
 // Define the expected request body structure
 interface RequestBody {
@@ -23,6 +23,11 @@ interface CombinedAnalysisResponse {
 // --- Helper to Fetch Rules for a Single Subreddit ---
 async function fetchRulesForSubreddit(subreddit: string, accessToken: string): Promise<RedditRule[]> {
   const subName = subreddit.replace(/^r\//, '');
+  const cachedRules = getCachedRules(subName);
+  if (cachedRules) {
+    return cachedRules;
+  }
+
   const rulesApiUrl = `https://oauth.reddit.com/r/${subName}/about/rules.json`;
   console.log(`Fetching rules for r/${subName} (within analyze)...`);
   try {
@@ -34,9 +39,11 @@ async function fetchRulesForSubreddit(subreddit: string, accessToken: string): P
       },
       // Ignore response status code errors for individual fetches (we handle errors below)
       ignoreResponseError: true, 
+      ...REDDIT_FETCH_RETRY, // Applies to network errors only, given ignoreResponseError
     });
     // Check for explicit error structure or empty/invalid response if needed
     if (rulesResponse && Array.isArray(rulesResponse.rules)) {
+        setCachedRules(subName, rulesResponse.rules);
         return rulesResponse.rules;
     } else {
         console.warn(`No rules found or invalid format for r/${subName}`);
@@ -1,5 +1,6 @@
 import { OpenAI } from 'openai';
-import { getRedditAccessToken } from '../utils/reddit';
+import { getRedditAccessToken, REDDIT_FETCH_RETRY } from '../utils/reddit';
+import { mapWithConcurrency } from '../utils/concurrency';
 
 // Define the expected request body structure
 interface RequestBody {
@@ -84,6 +85,12 @@ interface AnalysisResult {
   averageSentiment: string;
 }
 
+// Maximum number of comment requests in flight at once
+const COMMENT_FETCH_CONCURRENCY = 4;
+
+// Placeholder bodies Reddit returns for deleted or removed comments
+const DROPPED_BODIES = new Set(['[deleted]', '[removed]']);
+
 // Helper function to fetch Reddit posts
 async function fetchRedditPosts(subreddit: string, limit: number, accessToken: string): Promise<RedditPost[]> {
   const url = `https://oauth.reddit.com/r/${subreddit}/hot.json?limit=${limit}`;
@@ -94,7 +101,8 @@ async function fetchRedditPosts(subreddit: string, limit: number, accessToken: s
       headers: {
         'Authorization': `Bearer ${accessToken}`,
         'User-Agent': 'RedditSentimentAnalyzer/1.0'
-      }
+      },
+      ...REDDIT_FETCH_RETRY
     });
 
     return response.data.children;
@@ -114,15 +122,14 @@ async function fetchPostComments(subreddit: string, postId: string, accessToken:
       headers: {
         'Authorization': `Bearer ${accessToken}`,
         'User-Agent': 'RedditSentimentAnalyzer/1.0'
-      }
+      },
+      ...REDDIT_FETCH_RETRY
     });
 
     // Reddit comments endpoint returns an array where the second element contains comments
     if (response.length > 1 && response[1].data.children) {
       return response[1].data.children.filter(comment => 
-        comment.data.body && 
-        comment.data.body !== '[deleted]' && 
-        comment.data.body !== '[removed]'
+        comment.data.body && !DROPPED_BODIES.has(comment.data.body)
       );
     }
     
@@ -182,12 +189,17 @@ export default defineEventHandler(async (event): Promise<AnalysisResult> => {
   const topPosts = posts.slice(0, Math.min(10, posts.length));
   const allComments: RedditComment[] = [];
 
-  for (const post of topPosts) {
+  // Fetch with a small pool of workers, keeping results in post order
+  const commentsByPost = await mapWithConcurrency(topPosts, COMMENT_FETCH_CONCURRENCY, async (post) => {
     const comments = await fetchPostComments(subreddit, post.data.id, accessToken);
-    allComments.push(...comments.slice(0, 20)); // Limit to 20 comments per post
     
     // Add a small delay to avoid rate limiting
     await new Promise(resolve => setTimeout(resolve, 100));
+    return comments;
+  });
+
+  for (const comments of commentsByPost) {
+    allComments.push(...comments.slice(0, 20)); // Limit to 20 comments per post
   }
 
   // Prepare content for OpenAI analysis
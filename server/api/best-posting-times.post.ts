@@ -1,4 +1,5 @@
-import { getRedditAccessToken } from '../utils/reddit';
+import { getRedditAccessToken, REDDIT_FETCH_RETRY } from '../utils/reddit';
+import { mapWithConcurrency } from '../utils/concurrency';
 
 // --- Interfaces --- 
 interface RequestBody {
@@ -48,6 +49,7 @@ const POST_LIMIT = 50; // Number of top posts to fetch per subreddit
 const TIME_PERIOD = 'month'; // Time period for top posts ('hour', 'day', 'week', 'month', 'year', 'all')
 const TOP_SLOTS_COUNT = 3; // Number of best time slots to return
 const MIN_POSTS_FOR_AVG = 3; // Minimum posts needed in a slot to calculate a reliable average
+const SUBREDDIT_CONCURRENCY = 3; // Maximum number of subreddits fetched at once
 
 // --- Helper: Analyze Posts for Best Times --- 
 function analyzePostTimes(posts: RedditPost[]): BestTimeSlot[] {
@@ -115,8 +117,8 @@ export default defineEventHandler(async (event): Promise<BestTimesResponse> => {
         return results;
     }
 
-    // Process subreddits sequentially to reduce concurrent load / rate limit risk
-    for (const subreddit of body.subreddits) {
+    // Fetch up to SUBREDDIT_CONCURRENCY subreddits at once; the 250ms delay below is per worker
+    await mapWithConcurrency(body.subreddits, SUBREDDIT_CONCURRENCY, async (subreddit) => {
         const subName = subreddit.replace(/^r\//, '');
         const apiUrl = `https://oauth.reddit.com/r/${subName}/top.json?t=${TIME_PERIOD}&limit=${POST_LIMIT}`;
         console.log(`Fetching top posts for r/${subName} for time analysis...`);
@@ -129,6 +131,7 @@ export default defineEventHandler(async (event): Promise<BestTimesResponse> => {
                     'User-Agent': 'RedditOutreachAutomator/0.1 by YourUsername' // Use consistent User-Agent
                 },
                 ignoreResponseError: true, // Handle errors manually
+                ...REDDIT_FETCH_RETRY, // Applies to network errors only, given ignoreResponseError
             });
             
             // Basic check on response structure
@@ -151,7 +154,7 @@ export default defineEventHandler(async (event): Promise<BestTimesResponse> => {
             if (response.data.children.length === 0) {
                  console.log(`No posts returned for r/${subName} in the last ${TIME_PERIOD}.`);
                  results[subName] = { bestTimes: [] }; // Indicate no data found
-                 continue; // Skip to next subreddit
+                 return; // Skip to next subreddit
             }
 
             // Analyze the post times
@@ -166,7 +169,7 @@ export default defineEventHandler(async (event): Promise<BestTimesResponse> => {
             console.error(`Error processing subreddit r/${subName} for time analysis:`, error);
             results[subreddit] = { error: error.message || 'Failed to analyze posting times.' };
         }
-    }
+    });
 
     console.log('Finished best posting time analysis.');
     return results;
@@ -66,8 +66,9 @@ export default defineEventHandler(async (event) => {
         env: env
       });
       
-      let stdout = '';
-      let stderr = '';
+      // Collect raw chunks and decode once on exit
+      const stdoutChunks: Buffer[] = [];
+      const stderrChunks: Buffer[] = [];
       
       // Set a timeout for the process (2 minutes)
       const timeout = setTimeout(() => {
@@ -76,15 +77,17 @@ export default defineEventHandler(async (event) => {
       }, 120000);
       
       childProcess.stdout.on('data', (data: Buffer) => {
-        stdout += data.toString();
+        stdoutChunks.push(data);
       });
       
       childProcess.stderr.on('data', (data: Buffer) => {
-        stderr += data.toString();
+        stderrChunks.push(data);
       });
       
       childProcess.on('close', (code: number) => {
         clearTimeout(timeout);
+        const stdout = Buffer.concat(stdoutChunks).toString();
+        const stderr = Buffer.concat(stderrChunks).toString();
         if (code === 0) {
           resolve(stdout);
         } else {
@@ -107,13 +110,16 @@ export default defineEventHandler(async (event) => {
       const fs = await import('fs');
       const outputDir = path.join(pythonAnalysisPath, 'output');
       
-      // Find the most recent analysis JSON file
-      const files = fs.readdirSync(outputDir);
-      const jsonFiles = files.filter(f => f.startsWith('enhanced_opportunities_') && f.endsWith('.json'));
+      // Find the most recent analysis JSON file in a single pass
+      // (filename contains timestamp, so the greatest name is the latest)
+      let latestFile: string | null = null;
+      for (const f of fs.readdirSync(outputDir)) {
+        if (f.startsWith('enhanced_opportunities_') && f.endsWith('.json') && (latestFile === null || f > latestFile)) {
+          latestFile = f;
+        }
+      }
       
-      if (jsonFiles.length > 0) {
-        // Sort by timestamp (filename contains timestamp)
-        const latestFile = jsonFiles.sort().reverse()[0];
+      if (latestFile) {
         const jsonPath = path.join(outputDir, latestFile);
         
         const jsonContent = fs.readFileSync(jsonPath, 'utf-8');
@@ -53,18 +53,21 @@ export default defineEventHandler(async (event) => {
         env: env
       });
       
-      let stdout = '';
-      let stderr = '';
+      // Collect raw chunks and decode once on exit
+      const stdoutChunks: Buffer[] = [];
+      const stderrChunks: Buffer[] = [];
       
       childProcess.stdout.on('data', (data: Buffer) => {
-        stdout += data.toString();
+        stdoutChunks.push(data);
       });
       
       childProcess.stderr.on('data', (data: Buffer) => {
-        stderr += data.toString();
+        stderrChunks.push(data);
       });
       
       childProcess.on('close', (code: number) => {
+        const stdout = Buffer.concat(stdoutChunks).toString();
+        const stderr = Buffer.concat(stderrChunks).toString();
         if (code === 0) {
           resolve(stdout);
         } else {
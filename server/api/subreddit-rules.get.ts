@@ -1,7 +1,7 @@
 // This file might become obsolete if rules are always fetched in analyze-article
 // Keeping it for now, but removing the duplicated helper function and types.
 
-import { getRedditAccessToken, type RedditRule, type RedditRulesResponse } from '../utils/reddit'; // Import from util
+import { getRedditAccessToken, getCachedRules, setCachedRules, REDDIT_FETCH_RETRY, type RedditRule, type RedditRulesResponse } from '../utils/reddit'; // Import from util
 
 // Types are now imported from ../utils/reddit
 // interface RedditRule { ... }
@@ -16,13 +16,19 @@ export default defineEventHandler(async (event) => {
   const query = getQuery(event);
   const subredditName = query.name as string;
 
-  if (!subredditName) {
+  if (!subredditName || typeof subredditName !== 'string') { // Repeated ?name= params arrive as an array
     throw createError({
       statusCode: 400,
       statusMessage: `Missing subreddit name in query parameter (${subredditName}).`,
     });
   }
 
+  // Serve repeated lookups from the in-memory cache
+  const cachedRules = getCachedRules(subredditName);
+  if (cachedRules) {
+    return { rules: cachedRules };
+  }
+
   try {
     const accessToken = await getRedditAccessToken(config);
 
@@ -35,9 +41,14 @@ export default defineEventHandler(async (event) => {
         'Authorization': `Bearer ${accessToken}`,
         'User-Agent': 'RedditOutreachAutomator/0.1 by YourUsername' // Replace YourUsername or make dynamic
       },
+      ...REDDIT_FETCH_RETRY,
     });
 
     console.log(`Successfully fetched rules for r/${subredditName}.`);
+    // Only cache a well-formed rules list, not the empty fallback
+    if (Array.isArray(rulesResponse.rules)) {
+      setCachedRules(subredditName, rulesResponse.rules);
+    }
     return { rules: rulesResponse.rules || [] }; 
 
   } catch (error: any) {
@@ -1,4 +1,4 @@
-import { readFileSync } from 'fs';
+import { readFileSync, statSync } from 'fs';
 import path from 'path';
 
 interface SubredditOption {
@@ -9,16 +9,34 @@ interface SubredditOption {
   business_relevance: string;
 }
 
+// --- Parsed Subreddit List Cache (Simple In-Memory) ---
+interface CachedSubreddits {
+  mtimeMs: number; // Modification time of subreddits_nz.json the list was built from
+  subreddits: SubredditOption[];
+}
+let subredditsCache: CachedSubreddits | null = null;
+
 export default defineEventHandler(async (event) => {
   try {
     // Read the subreddits JSON file from the Python analysis directory
     const pythonAnalysisPath = path.join(process.cwd(), '..', 'python_analysis_reddit');
     const subredditsFilePath = path.join(pythonAnalysisPath, 'subreddits_nz.json');
     
+    // Reuse the previously built list unless the file changed since
+    const { mtimeMs } = statSync(subredditsFilePath);
+    if (subredditsCache && subredditsCache.mtimeMs === mtimeMs) {
+      return {
+        success: true,
+        subreddits: subredditsCache.subreddits,
+        total: subredditsCache.subreddits.length
+      };
+    }
+    
     const fileContent = readFileSync(subredditsFilePath, 'utf-8');
     const data = JSON.parse(fileContent);
     
     const subreddits: SubredditOption[] = [];
+    const seen = new Set<string>();
     
     // Extract subreddits from different tiers and categories
     const nzSubreddits = data.nz_subreddits;
@@ -26,6 +44,7 @@ export default defineEventHandler(async (event) => {
     // Add tier 1 major subreddits
     if (nzSubreddits.tiers?.tier_1_major?.subreddits) {
       nzSubreddits.tiers.tier_1_major.subreddits.forEach((sub: any) => {
+        seen.add(sub.name);
         subreddits.push({
           name: sub.name,
           subscribers: sub.subscribers,
@@ -39,6 +58,7 @@ export default defineEventHandler(async (event) => {
     // Add tier 2 medium subreddits
     if (nzSubreddits.tiers?.tier_2_medium?.subreddits) {
       nzSubreddits.tiers.tier_2_medium.subreddits.forEach((sub: any) => {
+        seen.add(sub.name);
         subreddits.push({
           name: sub.name,
           subscribers: sub.subscribers,
@@ -53,7 +73,8 @@ export default defineEventHandler(async (event) => {
     if (nzSubreddits.categories?.business_finance) {
       nzSubreddits.categories.business_finance.forEach((sub: any) => {
         // Only add if not already included
-        if (!subreddits.find(s => s.name === sub.name)) {
+        if (!seen.has(sub.name)) {
+          seen.add(sub.name);
           subreddits.push({
             name: sub.name,
             subscribers: sub.subscribers,
@@ -69,7 +90,8 @@ export default defineEventHandler(async (event) => {
     if (nzSubreddits.categories?.regional_cities) {
       nzSubreddits.categories.regional_cities.forEach((sub: any) => {
         // Only add if not already included and has reasonable size
-        if (!subreddits.find(s => s.name === sub.name) && sub.subscribers > 5000) {
+        if (!seen.has(sub.name) && sub.subscribers > 5000) {
+          seen.add(sub.name);
           subreddits.push({
             name: sub.name,
             subscribers: sub.subscribers,
@@ -94,6 +116,8 @@ export default defineEventHandler(async (event) => {
       return b.subscribers - a.subscribers; // Then by subscriber count
     });
     
+    subredditsCache = { mtimeMs, subreddits };
+    
     return {
       success: true,
       subreddits: subreddits,
@@ -8,6 +8,49 @@ interface CachedToken {
 let tokenCache: CachedToken | null = null;
 const TOKEN_EXPIRY_BUFFER = 60 * 1000; // Refresh token 1 minute before it expires
 
+// --- Reddit Fetch Retry Policy ---
+// Only retry transient server/gateway errors; fail fast on 429 instead of retrying into the rate limit.
+// 500 is included because $fetch reports network failures (no response) as 500, so this also retries real 500s.
+// Note: with ignoreResponseError, $fetch skips retries on HTTP error responses but still retries network errors.
+export const REDDIT_FETCH_RETRY = {
+  retry: 2,
+  retryDelay: 300,
+  retryStatusCodes: [500, 502, 503]
+};
+
+// --- Reddit Rules Cache (Simple In-Memory) ---
+interface CachedRules {
+  rules: RedditRule[];
+  expiresAt: number; // Timestamp (ms) when the cached rules go stale
+}
+const rulesCache = new Map<string, CachedRules>();
+const RULES_CACHE_TTL = 60 * 60 * 1000; // Subreddit rules rarely change, keep them for 1 hour
+
+// --- Helper: Read/Write Cached Subreddit Rules ---
+function rulesCacheKey(subreddit: string): string {
+  return subreddit.replace(/^r\//, '').toLowerCase(); // Same key for "r/name" and "name"
+}
+
+export function getCachedRules(subreddit: string): RedditRule[] | null {
+  const key = rulesCacheKey(subreddit);
+  const cached = rulesCache.get(key);
+  if (!cached) return null;
+  if (cached.expiresAt <= Date.now()) {
+    rulesCache.delete(key);
+    return null;
+  }
+  return cached.rules;
+}
+
+export function setCachedRules(subreddit: string, rules: RedditRule[]): void {
+  const now = Date.now();
+  // Prune expired entries so the cache doesn't grow with every subreddit ever looked up
+  for (const [key, cached] of rulesCache) {
+    if (cached.expiresAt <= now) rulesCache.delete(key);
+  }
+  rulesCache.set(rulesCacheKey(subreddit), { rules, expiresAt: now + RULES_CACHE_TTL });
+}
+
 // --- Helper: Get Reddit App-Only Access Token ---
 export async function getRedditAccessToken(config: any): Promise<string> {
   const now = Date.now();